@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 import logging
 from typing import Any
 
+import orjson
 from pybotvac.exceptions import NeatoException, NeatoRobotException
 from pybotvac.robot import Robot
 from pybotvac.vorwerk import Vorwerk
@@ -36,6 +38,7 @@ from .const import (
     ROBOT_STATE_ERROR,
     ROBOT_STATE_IDLE,
     ROBOT_STATE_PAUSE,
+    VORWERK_DEFAULT_ENDPOINT,
     VORWERK_DOMAIN,
     VORWERK_PLATFORMS,
     VORWERK_ROBOT_API,
@@ -52,23 +55,35 @@ _LOGGER = logging.getLogger(__name__)
 
 
 VORWERK_SCHEMA = vol.Schema(
-    vol.All(
-        {
-            vol.Required(VORWERK_ROBOT_NAME): cv.string,
-            vol.Required(VORWERK_ROBOT_SERIAL): cv.string,
-            vol.Required(VORWERK_ROBOT_SECRET): cv.string,
-            vol.Optional(
-                VORWERK_ROBOT_ENDPOINT, default="https://nucleo.ksecosys.com:4443"
-            ): cv.string,
-        }
-    )
+    {
+        vol.Required(VORWERK_ROBOT_NAME): cv.string,
+        vol.Required(VORWERK_ROBOT_SERIAL): cv.string,
+        vol.Required(VORWERK_ROBOT_SECRET): cv.string,
+        vol.Optional(
+            VORWERK_ROBOT_ENDPOINT, default=VORWERK_DEFAULT_ENDPOINT
+        ): cv.string,
+    }
 )
 
 CONFIG_SCHEMA = vol.Schema(
-    {VORWERK_DOMAIN: vol.Schema(vol.All(cv.ensure_list, [VORWERK_SCHEMA]))},
+    {VORWERK_DOMAIN: vol.All(cv.ensure_list, [VORWERK_SCHEMA])},
     extra=vol.ALLOW_EXTRA,
 )
 
+# Robot states that map to a vacuum state without looking at the action.
+_STATE_BY_ROBOT_STATE = {
+    ROBOT_STATE_IDLE: STATE_IDLE,
+    ROBOT_STATE_PAUSE: STATE_PAUSED,
+    ROBOT_STATE_ERROR: STATE_ERROR,
+}
+
+# Vacuum states whose status message does not depend on the robot state details.
+_STATUS_BY_STATE = {
+    STATE_IDLE: "Stopped",
+    STATE_PAUSED: "Paused",
+    STATE_RETURNING: "Returning",
+}
+
 
 async def async_setup(hass: HomeAssistantType, config: ConfigType) -> bool:
     """Set up the Vorwerk component."""
@@ -91,38 +106,53 @@ async def async_setup_entry(hass: HomeAssistantType, entry: ConfigEntry) -> bool
     robots = await _async_create_robots(hass, entry.data[VORWERK_ROBOTS])
 
     robot_states = [VorwerkState(robot) for robot in robots]
+    coordinator = _create_coordinator(hass, entry, robot_states)
+
+    await coordinator.async_config_entry_first_refresh()
 
     hass.data[VORWERK_DOMAIN][entry.entry_id] = {
         VORWERK_ROBOTS: [
             {
                 VORWERK_ROBOT_API: r,
-                VORWERK_ROBOT_COORDINATOR: _create_coordinator(hass, r),
+                VORWERK_ROBOT_COORDINATOR: coordinator,
             }
             for r in robot_states
         ]
     }
 
-    for component in VORWERK_PLATFORMS:
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(entry, component)
-        )
+    await hass.config_entries.async_forward_entry_setups(entry, VORWERK_PLATFORMS)
 
     return True
 
 
 def _create_coordinator(
-    hass: HomeAssistantType, robot_state: VorwerkState
+    hass: HomeAssistantType, entry: ConfigEntry, robot_states: list[VorwerkState]
 ) -> DataUpdateCoordinator:
-    async def async_update_data():
+    async def async_update_data() -> dict[str, dict[Any, Any]]:
         """Fetch data from API endpoint."""
-        await hass.async_add_executor_job(robot_state.update)
+        results = await asyncio.gather(
+            *(robot_state.async_update(hass) for robot_state in robot_states),
+            return_exceptions=True,
+        )
+        for robot_state, result in zip(robot_states, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Unexpected error updating Vorwerk robot '%s'",
+                    robot_state.name,
+                    exc_info=result,
+                )
+        # The raw robot states let the coordinator skip updates when nothing changed.
+        return {
+            robot_state.serial: robot_state.robot_state for robot_state in robot_states
+        }
 
     return DataUpdateCoordinator(
         hass,
         _LOGGER,
-        name=robot_state.robot.name,
+        name=entry.title,
         update_method=async_update_data,
         update_interval=MIN_TIME_BETWEEN_UPDATES,
+        always_update=False,
     )
 
 
@@ -154,175 +184,223 @@ async def _async_create_robots(hass, robot_confs):
 
 async def async_unload_entry(hass: HomeAssistantType, entry: ConfigEntry) -> bool:
     """Unload config entry."""
-    unload_ok: bool = all(
-        await asyncio.gather(
-            *(
-                hass.config_entries.async_forward_entry_unload(entry, component)
-                for component in VORWERK_PLATFORMS
-            )
-        )
+    unload_ok: bool = await hass.config_entries.async_unload_platforms(
+        entry, VORWERK_PLATFORMS
     )
     if unload_ok:
         hass.data[VORWERK_DOMAIN].pop(entry.entry_id)
     return unload_ok
 
 
+@lru_cache(maxsize=64)
+def _resolve_alert(alert: str) -> str:
+    """Return the message for a robot alert code."""
+    return ALERTS.get(alert, alert)
+
+
+@lru_cache(maxsize=64)
+def _resolve_error(error: str) -> str:
+    """Return the message for a robot error code."""
+    return ERRORS.get(error, error)
+
+
 class VorwerkState:
     """Class to convert robot_state dict to more useful object."""
 
+    __slots__ = (
+        "robot",
+        "name",
+        "serial",
+        "robot_state",
+        "robot_info",
+        "available",
+        "_cache",
+        "_device_info",
+    )
+
     def __init__(self, robot: Robot) -> None:
         """Initialize new vorwerk vacuum state."""
         self.robot = robot
+        self.name: str = robot.name
+        self.serial: str = robot.serial
         self.robot_state: dict[Any, Any] = {}
         self.robot_info: dict[Any, Any] = {}
+        self.available: bool = False
+        self._cache: dict[str, Any] = {}
+        self._device_info: DeviceInfo | None = None
 
-    @property
-    def available(self) -> bool:
-        """Return true when robot state is available."""
-        return bool(self.robot_state)
-
-    def update(self):
+    async def async_update(self, hass: HomeAssistantType) -> None:
         """Update robot state and robot info."""
-        _LOGGER.debug("Running Vorwerk Vacuums update for '%s'", self.robot.name)
-        self._update_robot_info()
-        self._update_state()
+        _LOGGER.debug("Running Vorwerk Vacuums update for '%s'", self.name)
+        jobs = [hass.async_add_executor_job(self._update_state)]
+        if not self.robot_info:
+            # General info (model, firmware, vendor) is static, fetch it only once.
+            jobs.append(hass.async_add_executor_job(self._update_robot_info))
+        # Let both jobs finish so neither writes state after a failure is handled.
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        try:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            self._cache = self._build_cache()
+        except Exception:
+            # Never publish derived values that disagree with the raw robot state.
+            self.robot_state = {}
+            self.available = False
+            self._cache = {}
+            raise
 
     def _update_robot_info(self):
         try:
-            if not self.robot_info:
-                self.robot_info = self.robot.get_general_info().json().get("data")
+            self.robot_info = orjson.loads(
+                self.robot.get_general_info().content
+            ).get("data")
+            self._device_info = None
         except NeatoRobotException:
-            _LOGGER.warning("Couldn't fetch robot information of %s", self.robot.name)
+            _LOGGER.warning("Couldn't fetch robot information of %s", self.name)
 
     def _update_state(self):
         try:
             self.robot_state = self.robot.state
-            _LOGGER.debug(self.robot_state)
+            _LOGGER.debug("Robot state of '%s': %s", self.name, self.robot_state)
         except NeatoRobotException as ex:
             if self.available:  # print only once when available
                 _LOGGER.error(
-                    "Vorwerk vacuum connection error for '%s': %s", self.robot.name, ex
+                    "Vorwerk vacuum connection error for '%s': %s", self.name, ex
                 )
             self.robot_state = {}
-            return
+        self.available = bool(self.robot_state)
+
+    def _build_cache(self) -> dict[str, Any]:
+        """Compute the derived robot values once per update."""
+        if not self.available:
+            return {}
+        docked = self._compute_docked()
+        charging = self._compute_charging()
+        state = self._compute_state(docked, charging)
+        alert = self._compute_alert()
+        return {
+            "docked": docked,
+            "charging": charging,
+            "state": state,
+            "alert": alert,
+            "status": self._compute_status(state, alert, docked),
+            "battery_level": self._compute_battery_level(),
+            "schedule_enabled": self._compute_schedule_enabled(),
+        }
 
     @property
     def docked(self) -> bool | None:
         """Vacuum is docked."""
-        if not self.available:
-            return None
+        return self._cache.get("docked")
+
+    @property
+    def charging(self) -> bool | None:
+        """Vacuum is charging."""
+        return self._cache.get("charging")
+
+    @property
+    def state(self) -> str | None:
+        """Return Home Assistant vacuum state."""
+        return self._cache.get("state")
+
+    @property
+    def alert(self) -> str | None:
+        """Return vacuum alert message."""
+        return self._cache.get("alert")
+
+    @property
+    def status(self) -> str | None:
+        """Return vacuum status message."""
+        return self._cache.get("status")
+
+    @property
+    def battery_level(self) -> int | None:
+        """Return the battery level of the vacuum cleaner."""
+        return self._cache.get("battery_level")
+
+    @property
+    def schedule_enabled(self):
+        """Return True when schedule is enabled."""
+        return self._cache.get("schedule_enabled")
+
+    def _compute_docked(self) -> bool:
+        """Vacuum is docked."""
         return (
             self.robot_state["state"] == ROBOT_STATE_IDLE
             and self.robot_state["details"]["isDocked"]
         )
 
-    @property
-    def charging(self) -> bool | None:
+    def _compute_charging(self) -> bool:
         """Vacuum is charging."""
-        if not self.available:
-            return None
         return (
             self.robot_state.get("state") == ROBOT_STATE_IDLE
             and self.robot_state["details"]["isCharging"]
         )
 
-    @property
-    def state(self) -> str | None:
+    def _compute_state(self, docked: bool, charging: bool) -> str | None:
         """Return Home Assistant vacuum state."""
-        if not self.available:
-            return None
+        if charging or docked:
+            return STATE_DOCKED
         robot_state = self.robot_state.get("state")
-        state = None
-        if self.charging or self.docked:
-            state = STATE_DOCKED
-        elif robot_state == ROBOT_STATE_IDLE:
-            state = STATE_IDLE
-        elif robot_state == ROBOT_STATE_BUSY:
-            action = self.robot_state.get("action")
-            if action in ROBOT_CLEANING_ACTIONS:
-                state = STATE_CLEANING
-            else:
-                state = STATE_RETURNING
-        elif robot_state == ROBOT_STATE_PAUSE:
-            state = STATE_PAUSED
-        elif robot_state == ROBOT_STATE_ERROR:
-            state = STATE_ERROR
-        return state
+        if robot_state == ROBOT_STATE_BUSY:
+            if self.robot_state.get("action") in ROBOT_CLEANING_ACTIONS:
+                return STATE_CLEANING
+            return STATE_RETURNING
+        return _STATE_BY_ROBOT_STATE.get(robot_state)
 
-    @property
-    def alert(self) -> str | None:
+    def _compute_alert(self) -> str | None:
         """Return vacuum alert message."""
-        if not self.available:
-            return None
         if "alert" in self.robot_state:
-            return ALERTS.get(self.robot_state["alert"], self.robot_state["alert"])
+            return _resolve_alert(self.robot_state["alert"])
         return None
 
-    @property
-    def status(self) -> str | None:
+    def _compute_status(
+        self, state: str | None, alert: str | None, docked: bool
+    ) -> str | None:
         """Return vacuum status message."""
-        if not self.available:
-            return None
-
-        status = None
-        if self.state == STATE_ERROR:
-            status = self._error_status()
-        elif self.alert:
-            status = self.alert
-        elif self.state == STATE_DOCKED:
-            if self.charging:
-                status = "Charging"
-            if self.docked:
-                status = "Docked"
-        elif self.state == STATE_IDLE:
-            status = "Stopped"
-        elif self.state == STATE_CLEANING:
-            status = self._cleaning_status()
-        elif self.state == STATE_PAUSED:
-            status = "Paused"
-        elif self.state == STATE_RETURNING:
-            status = "Returning"
-
-        return status
+        if state == STATE_ERROR:
+            return self._error_status()
+        if alert:
+            return alert
+        if state == STATE_DOCKED:
+            return "Docked" if docked else "Charging"
+        if state == STATE_CLEANING:
+            return self._cleaning_status()
+        return _STATUS_BY_STATE.get(state)
 
     def _error_status(self):
         """Return error status."""
-        return ERRORS.get(self.robot_state["error"], self.robot_state["error"])
+        return _resolve_error(self.robot_state["error"])
 
     def _cleaning_status(self):
         """Return cleaning status."""
-        status_items = [
-            MODE.get(self.robot_state["cleaning"]["mode"]),
-            ACTION.get(self.robot_state["action"]),
-        ]
-        if (
-            "boundary" in self.robot_state["cleaning"]
-            and "name" in self.robot_state["cleaning"]["boundary"]
-        ):
-            status_items.append(self.robot_state["cleaning"]["boundary"]["name"])
-        return " ".join(s for s in status_items if s)
+        cleaning = self.robot_state["cleaning"]
+        mode = MODE.get(cleaning["mode"])
+        action = ACTION.get(self.robot_state["action"])
+        boundary_name = cleaning.get("boundary", {}).get("name")
+        return " ".join(filter(None, (mode, action, boundary_name)))
 
-    @property
-    def battery_level(self) -> str | None:
+    def _compute_battery_level(self) -> int | None:
         """Return the battery level of the vacuum cleaner."""
-        if not self.available:
-            return None
-        return self.robot_state["details"]["charge"]
+        charge = self.robot_state["details"].get("charge")
+        return int(charge) if charge is not None else None
+
+    def _compute_schedule_enabled(self) -> bool:
+        """Return True when schedule is enabled."""
+        return bool(self.robot_state["details"]["isScheduleEnabled"])
 
     @property
     def device_info(self) -> DeviceInfo:
         """Device info for robot."""
-        return DeviceInfo(
-            identifiers={(VORWERK_DOMAIN, self.robot.serial)},
-            manufacturer=self.robot_info["battery"]["vendor"] if self.robot_info else None,
-            model=self.robot_info["model"] if self.robot_info else None,
-            name=self.robot.name,
-            sw_version=self.robot_info["firmware"] if self.robot_info else None,
-        )
-
-    @property
-    def schedule_enabled(self):
-        """Return True when schedule is enabled."""
-        if not self.available:
-            return None
-        return bool(self.robot_state["details"]["isScheduleEnabled"])
+        if self._device_info is None:
+            self._device_info = DeviceInfo(
+                identifiers={(VORWERK_DOMAIN, self.serial)},
+                manufacturer=self.robot_info["battery"]["vendor"]
+                if self.robot_info
+                else None,
+                model=self.robot_info["model"] if self.robot_info else None,
+                name=self.name,
+                sw_version=self.robot_info["firmware"] if self.robot_info else None,
+            )
+        return self._device_info
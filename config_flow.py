@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 import pybotvac
 from pybotvac.exceptions import NeatoException
@@ -12,8 +11,6 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_CODE, CONF_EMAIL, CONF_TOKEN
 
-
-# pylint: disable=unused-import
 from .const import (
     VORWERK_CLIENT_ID,
     VORWERK_DOMAIN,
@@ -33,7 +33,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
             VorwerkSensor(robot[VORWERK_ROBOT_API], robot[VORWERK_ROBOT_COORDINATOR])
             for robot in hass.data[VORWERK_DOMAIN][entry.entry_id][VORWERK_ROBOTS]
         ],
-        True,
+        False,
     )
 
 
@@ -47,18 +47,8 @@ class VorwerkSensor(CoordinatorEntity, Entity):
         super().__init__(coordinator)
         self.robot: Robot = robot_state.robot
         self._state: VorwerkState = robot_state
-        self._robot_name = f"{self.robot.name} {BATTERY}"
-        self._robot_serial = self.robot.serial
-
-    @property
-    def name(self):
-        """Return the name of this sensor."""
-        return self._robot_name
-
-    @property
-    def unique_id(self):
-        """Return unique ID."""
-        return self._robot_serial
+        self._attr_name = f"{robot_state.name} {BATTERY}"
+        self._attr_unique_id = robot_state.serial
 
     @property
     def device_class(self):
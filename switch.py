@@ -4,7 +4,6 @@ import logging
 from pybotvac.exceptions import NeatoRobotException
 from pybotvac.robot import Robot
 
-from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -36,7 +35,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     if not dev:
         return
 
-    async_add_entities(dev, True)
+    async_add_entities(dev, False)
 
 
 class VorwerkScheduleSwitch(CoordinatorEntity, ToggleEntity):
@@ -48,25 +47,15 @@ class VorwerkScheduleSwitch(CoordinatorEntity, ToggleEntity):
         """Initialize the Vorwerk Schedule switch."""
         super().__init__(coordinator)
         self.robot: Robot = robot_state.robot
-        self._robot_name = f"{self.robot.name} Schedule"
         self._state: VorwerkState = robot_state
-        self._robot_serial = self.robot.serial
-
-    @property
-    def name(self):
-        """Return the name of the switch."""
-        return self._robot_name
+        self._attr_name = f"{robot_state.name} Schedule"
+        self._attr_unique_id = robot_state.serial
 
     @property
     def available(self):
         """Return True if entity is available."""
         return self._state.available
 
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._robot_serial
-
     @property
     def is_on(self):
         """Return true if switch is on."""
@@ -1,6 +1,9 @@
 """Support for Neato Connected Vacuums."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import wraps
 import logging
 from typing import Any
 
@@ -10,10 +13,6 @@ import voluptuous as vol
 
 from homeassistant.components.vacuum import (
     ATTR_STATUS,
-    STATE_CLEANING,
-    STATE_DOCKED,
-    STATE_IDLE,
-    STATE_PAUSED,
     SUPPORT_BATTERY,
     SUPPORT_CLEAN_SPOT,
     SUPPORT_LOCATE,
@@ -25,6 +24,7 @@ from homeassistant.components.vacuum import (
     StateVacuumEntity,
 )
 from homeassistant.const import ATTR_MODE
+from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
@@ -37,6 +37,10 @@ from .const import (
     ATTR_CATEGORY,
     ATTR_NAVIGATION,
     ATTR_ZONE,
+    ROBOT_CLEANING_ACTIONS,
+    ROBOT_STATE_BUSY,
+    ROBOT_STATE_IDLE,
+    ROBOT_STATE_PAUSE,
     VORWERK_DOMAIN,
     VORWERK_ROBOT_API,
     VORWERK_ROBOT_COORDINATOR,
@@ -57,6 +61,15 @@ SUPPORT_VORWERK = (
     | SUPPORT_LOCATE
 )
 
+SERVICE_CUSTOM_CLEANING = "custom_cleaning"
+
+CUSTOM_CLEANING_SCHEMA = {
+    vol.Optional(ATTR_MODE, default=2): cv.positive_int,
+    vol.Optional(ATTR_NAVIGATION, default=1): cv.positive_int,
+    vol.Optional(ATTR_CATEGORY, default=4): cv.positive_int,
+    vol.Optional(ATTR_ZONE): cv.string,
+}
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up Vorwerk vacuum with config entry."""
@@ -69,24 +82,36 @@ async def async_setup_entry(hass, entry, async_add_entities):
             )
             for robot in hass.data[VORWERK_DOMAIN][entry.entry_id][VORWERK_ROBOTS]
         ],
-        True,
+        False,
     )
 
     platform = entity_platform.current_platform.get()
     assert platform is not None
 
     platform.async_register_entity_service(
-        "custom_cleaning",
-        {
-            vol.Optional(ATTR_MODE, default=2): cv.positive_int,
-            vol.Optional(ATTR_NAVIGATION, default=1): cv.positive_int,
-            vol.Optional(ATTR_CATEGORY, default=4): cv.positive_int,
-            vol.Optional(ATTR_ZONE): cv.string,
-        },
-        "vorwerk_custom_cleaning",
+        SERVICE_CUSTOM_CLEANING,
+        CUSTOM_CLEANING_SCHEMA,
+        "async_vorwerk_custom_cleaning",
     )
 
 
+def _log_neato_errors(
+    func: Callable[..., Awaitable[None]]
+) -> Callable[..., Awaitable[None]]:
+    """Log robot connection errors instead of raising them."""
+
+    @wraps(func)
+    async def wrapper(self: VorwerkConnectedVacuum, *args: Any, **kwargs: Any) -> None:
+        try:
+            await func(self, *args, **kwargs)
+        except NeatoRobotException as ex:
+            _LOGGER.error(
+                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
+            )
+
+    return wrapper
+
+
 class VorwerkConnectedVacuum(CoordinatorEntity, StateVacuumEntity):
     """Representation of a Vorwerk Connected Vacuum."""
 
@@ -98,122 +123,139 @@ class VorwerkConnectedVacuum(CoordinatorEntity, StateVacuumEntity):
         self.robot: Robot = robot_state.robot
         self._state: VorwerkState = robot_state
 
-        self._name = f"{self.robot.name}"
-        self._robot_serial = self.robot.serial
+        self._attr_name = robot_state.name
+        self._attr_unique_id = robot_state.serial
+        self._attr_icon = "mdi:robot-vacuum-variant"
+        self._attr_supported_features = SUPPORT_VORWERK
+        self._start_commands = {
+            ROBOT_STATE_IDLE: self.robot.start_cleaning,
+            ROBOT_STATE_PAUSE: self.robot.resume_cleaning,
+        }
+        self._update_extra_state_attributes()
         self._robot_boundaries: list = []
-
-    @property
-    def name(self) -> str:
-        """Return the name of the device."""
-        return self._name
-
-    @property
-    def supported_features(self) -> int:
-        """Flag vacuum cleaner robot features that are supported."""
-        return SUPPORT_VORWERK
+        self._commands: asyncio.Queue[tuple[Any, ...]] = asyncio.Queue()
+        self._last_queued_command: tuple[Any, ...] | None = None
+        self._command_worker: asyncio.Task | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start sending queued commands once the entity is added."""
+        await super().async_added_to_hass()
+        self._command_worker = self.hass.async_create_background_task(
+            self._async_process_commands(), f"vorwerk command worker {self.entity_id}"
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _update_extra_state_attributes(self) -> None:
+        """Rebuild the state attributes of the vacuum cleaner."""
+        status = self._state.status
+        self._attr_extra_state_attributes = (
+            {ATTR_STATUS: status} if status is not None else {}
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop sending commands and drop the pending ones."""
+        await super().async_will_remove_from_hass()
+        if self._command_worker is not None:
+            self._command_worker.cancel()
+            self._command_worker = None
+        while not self._commands.empty():
+            self._commands.get_nowait()
+        self._last_queued_command = None
 
     @property
     def battery_level(self) -> int | None:
         """Return the battery level of the vacuum cleaner."""
-        return int(self._state.battery_level) if self._state.battery_level else None
+        return self._state.battery_level
 
     @property
     def available(self) -> bool:
         """Return if the robot is available."""
         return self._state.available
 
-    @property
-    def icon(self) -> str:
-        """Return specific icon."""
-        return "mdi:robot-vacuum-variant"
-
     @property
     def state(self) -> str | None:
         """Return the status of the vacuum cleaner."""
         return self._state.state if self._state else None
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return self._robot_serial
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes of the vacuum cleaner."""
-        data: dict[str, Any] = {}
-
-        if self._state.status is not None:
-            data[ATTR_STATUS] = self._state.status
-
-        return data
-
     @property
     def device_info(self) -> DeviceInfo:
         """Device info for robot."""
         return self._state.device_info
 
-    def start(self) -> None:
-        """Start cleaning or resume cleaning."""
-        if not self._state:
+    def _queue_command(self, *command: Any) -> None:
+        """Queue a robot command unless it repeats the last pending one."""
+        if command == self._last_queued_command:
             return
-        try:
-            if self._state.state == STATE_IDLE or self._state.state == STATE_DOCKED:
-                self.robot.start_cleaning()
-            elif self._state.state == STATE_PAUSED:
-                self.robot.resume_cleaning()
-        except NeatoRobotException as ex:
-            _LOGGER.error(
-                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-            )
+        self._last_queued_command = command
+        self._commands.put_nowait(command)
+
+    async def _async_process_commands(self) -> None:
+        """Send queued commands to the robot one at a time."""
+        while True:
+            command = await self._commands.get()
+            if self._commands.empty():
+                self._last_queued_command = None
+            try:
+                await self._async_send_command(command)
+            except Exception:  # pylint: disable=broad-except
+                # Keep the worker alive, later commands must still be sent.
+                _LOGGER.exception(
+                    "Unexpected error sending command to '%s'", self.entity_id
+                )
+
+    @_log_neato_errors
+    async def _async_send_command(self, command: tuple[Any, ...]) -> None:
+        """Send a single command to the robot."""
+        await self.hass.async_add_executor_job(*command)
+
+    async def async_start(self) -> None:
+        """Start cleaning or resume cleaning."""
+        self._queue_command(self._start)
 
-    def pause(self) -> None:
+    def _start(self) -> None:
+        """Start or resume cleaning, depending on the current robot state."""
+        # Read the live state, earlier queued commands may have changed it.
+        command = self._start_commands.get(self.robot.state.get("state"))
+        if command is not None:
+            command()
+
+    async def async_pause(self) -> None:
         """Pause the vacuum."""
-        try:
-            self.robot.pause_cleaning()
-        except NeatoRobotException as ex:
-            _LOGGER.error(
-                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-            )
+        self._queue_command(self.robot.pause_cleaning)
 
-    def return_to_base(self, **kwargs: Any) -> None:
+    async def async_return_to_base(self, **kwargs: Any) -> None:
         """Set the vacuum cleaner to return to the dock."""
-        try:
-            if self._state.state == STATE_CLEANING:
-                self.robot.pause_cleaning()
-            self.robot.send_to_base()
-        except NeatoRobotException as ex:
-            _LOGGER.error(
-                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-            )
+        self._queue_command(self._return_to_base)
+
+    def _return_to_base(self) -> None:
+        """Pause a running cleaning and send the robot to its base."""
+        robot_state = self.robot.state
+        if (
+            robot_state.get("state") == ROBOT_STATE_BUSY
+            and robot_state.get("action") in ROBOT_CLEANING_ACTIONS
+        ):
+            self.robot.pause_cleaning()
+        self.robot.send_to_base()
 
-    def stop(self, **kwargs: Any) -> None:
+    async def async_stop(self, **kwargs: Any) -> None:
         """Stop the vacuum cleaner."""
-        try:
-            self.robot.stop_cleaning()
-        except NeatoRobotException as ex:
-            _LOGGER.error(
-                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-            )
+        self._queue_command(self.robot.stop_cleaning)
 
-    def locate(self, **kwargs: Any) -> None:
+    @_log_neato_errors
+    async def async_locate(self, **kwargs: Any) -> None:
         """Locate the robot by making it emit a sound."""
-        try:
-            self.robot.locate()
-        except NeatoRobotException as ex:
-            _LOGGER.error(
-                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-            )
+        await self.hass.async_add_executor_job(self.robot.locate)
 
-    def clean_spot(self, **kwargs: Any) -> None:
+    async def async_clean_spot(self, **kwargs: Any) -> None:
         """Run a spot cleaning starting from the base."""
-        try:
-            self.robot.start_spot_cleaning()
-        except NeatoRobotException as ex:
-            _LOGGER.error(
-                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-            )
+        self._queue_command(self.robot.start_spot_cleaning)
 
-    def vorwerk_custom_cleaning(
+    async def async_vorwerk_custom_cleaning(
         self, mode: str, navigation: str, category: str, zone: str | None = None
     ) -> None:
         """Zone cleaning service call."""
@@ -229,9 +271,6 @@ class VorwerkConnectedVacuum(CoordinatorEntity, StateVacuumEntity):
                 return
             _LOGGER.info("Start cleaning zone '%s' with robot %s", zone, self.entity_id)
 
-        try:
-            self.robot.start_cleaning(mode, navigation, category, boundary_id)
-        except NeatoRobotException as ex:
-            _LOGGER.error(
-                "Vorwerk vacuum connection error for '%s': %s", self.entity_id, ex
-            )
+        self._queue_command(
+            self.robot.start_cleaning, mode, navigation, category, boundary_id
+        )